@@ -1,7 +1,7 @@
 from faicons import icon_svg
 import plotly.graph_objects as go
 from shinywidgets import render_widget
-from shared import app_dir, df
+from shared import BREAKDOWNS, DEFAULT_BREAKDOWN, app_dir, churn_breakdown, df
 from shiny import reactive
 from shiny.express import input, render, ui
 import requests
@@ -60,139 +60,48 @@ with ui.layout_columns():
                     return fig
 
             with ui.nav_panel("Churn Insights"):
+                ui.input_select("breakdown", "Breakdown", choices=list(BREAKDOWNS), selected=DEFAULT_BREAKDOWN)
+
                 @render_widget
                 def vs_churn_chart():
-                    monthly_data = df.groupby(['MonthlyCharges_Bin', 'Churn']).size().unstack(fill_value=0)
-                    internet_data = df.groupby(['InternetService', 'Churn']).size().unstack(fill_value=0)
-                    contract_data = df.groupby(['Contract', 'Churn']).size().unstack(fill_value=0)
-                    tenure_data = df.groupby(['Tenure_Bin', 'Churn']).size().unstack(fill_value=0)
-                    security_data = df.groupby(['OnlineSecurity', 'Churn']).size().unstack(fill_value=0)
+                    # Rendered once per session; breakdowns are swapped in by update_vs_churn_chart
+                    with reactive.isolate():
+                        data = churn_breakdown(input.breakdown())
 
                     fig = go.Figure()
-
-                    fig.add_trace(go.Bar(
-                        x=monthly_data.index,
-                        y=monthly_data['Yes'],
-                        name="Churned (Yes)",
-                        marker_color="#EF553B",
-                        visible=True  
-                    ))
-                    fig.add_trace(go.Bar(
-                        x=monthly_data.index,
-                        y=monthly_data['No'],
-                        name="Not Churned (No)",
-                        marker_color="#636EFA",
-                        visible=True 
-                    ))
-
-                    # Internet Service
-                    fig.add_trace(go.Bar(
-                        x=internet_data.index,
-                        y=internet_data['Yes'],
-                        name="Churned (Yes)",
-                        marker_color="#EF553B",
-                        visible=False
-                    ))
-                    fig.add_trace(go.Bar(
-                        x=internet_data.index,
-                        y=internet_data['No'],
-                        name="Not Churned (No)",
-                        marker_color="#636EFA",
-                        visible=False
-                    ))
-
-                    # Contract
-                    fig.add_trace(go.Bar(
-                        x=contract_data.index,
-                        y=contract_data['Yes'],
-                        name="Churned (Yes)",
-                        marker_color="#EF553B",
-                        visible=False
-                    ))
                     fig.add_trace(go.Bar(
-                        x=contract_data.index,
-                        y=contract_data['No'],
-                        name="Not Churned (No)",
-                        marker_color="#636EFA",
-                        visible=False
-                    ))
-
-                    # Tenure
-                    fig.add_trace(go.Bar(
-                        x=tenure_data.index,
-                        y=tenure_data['Yes'],
+                        x=data["x"],
+                        y=data["yes"],
                         name="Churned (Yes)",
-                        marker_color="#EF553B",
-                        visible=False
+                        marker_color="#EF553B"
                     ))
                     fig.add_trace(go.Bar(
-                        x=tenure_data.index,
-                        y=tenure_data['No'],
+                        x=data["x"],
+                        y=data["no"],
                         name="Not Churned (No)",
-                        marker_color="#636EFA",
-                        visible=False
+                        marker_color="#636EFA"
                     ))
-
-                    # Online Security
-                    fig.add_trace(go.Bar(
-                        x=security_data.index,
-                        y=security_data['Yes'],
-                        name="Churned (Yes)",
-                        marker_color="#EF553B",
-                        visible=False
-                    ))
-                    fig.add_trace(go.Bar(
-                        x=security_data.index,
-                        y=security_data['No'],
-                        name="Not Churned (No)",
-                        marker_color="#636EFA",
-                        visible=False
-                    ))
-
                     fig.update_layout(
-                        updatemenus=[
-                            dict(
-                                buttons=[
-                                    dict(label="Monthly Charges",
-                                         method="update",
-                                         args=[{"visible": [True, True, False, False, False, False, False, False, False, False]},
-                                               {"xaxis": {"title": "Monthly Charges Range"},
-                                                "yaxis": {"title": "Customer Count"}}]),
-                                    dict(label="Internet Service",
-                                         method="update",
-                                         args=[{"visible": [False, False, True, True, False, False, False, False, False, False]},
-                                               {"xaxis": {"title": "Internet Service Type"},
-                                                "yaxis": {"title": "Customer Count"}}]),
-                                    dict(label="Contract",
-                                         method="update",
-                                         args=[{"visible": [False, False, False, False, True, True, False, False, False, False]},
-                                               {
-                                                "xaxis": {"title": "Contract Type"},
-                                                "yaxis": {"title": "Customer Count"}}]),
-                                    dict(label="Tenure",
-                                         method="update",
-                                         args=[{"visible": [False, False, False, False, False, False, True, True, False, False]},
-                                               {
-                                                "xaxis": {"title": "Tenure Range (Months)"},
-                                                "yaxis": {"title": "Customer Count"}}]),
-                                    dict(label="Online Security",
-                                         method="update",
-                                         args=[{"visible": [False, False, False, False, False, False, False, False, True, True]},
-                                               {
-                                                "xaxis": {"title": "Online Security Status"},
-                                                "yaxis": {"title": "Customer Count"}}]),
-                                ],
-                                direction="down",
-                                showactive=True
-                            )
-                        ],
-                        xaxis=dict(title="Monthly Charges Range"),  
-                        yaxis=dict(title="Customer Count"),  
+                        xaxis=dict(title=data["title"]),
+                        yaxis=dict(title="Customer Count"),
                         barmode="stack"
                     )
                     fig.update_layout(template="plotly_dark")
 
                     return fig
+
+                @reactive.effect
+                def update_vs_churn_chart():
+                    data = churn_breakdown(input.breakdown())
+
+                    widget = vs_churn_chart.widget
+                    with widget.batch_update():
+                        widget.data[0].x = data["x"]
+                        widget.data[0].y = data["yes"]
+                        widget.data[1].x = data["x"]
+                        widget.data[1].y = data["no"]
+                        widget.layout.xaxis.title.text = data["title"]
+
             with ui.nav_panel("Churn prediction API"):
                 @render.code
                 def api_response():
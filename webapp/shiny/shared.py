@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pathlib import Path
 from sklearn.preprocessing import LabelEncoder
 import pandas as pd
@@ -15,3 +16,30 @@ df['Churn'] = df['Churn'].map({0: 'No', 1: 'Yes'})
 # Additional preprocessing for DP.py charts
 df['MonthlyCharges_Bin'] = pd.cut(df['MonthlyCharges'], bins=[0, 20, 40, 60, 80, 100, 120, float('inf')], labels=['0-20', '21-40', '41-60', '61-80', '81-100', '101-120', '120+'])
 df['Tenure_Bin'] = pd.cut(df['tenure'], bins=[0, 12, 24, 36, 48, 60, 72], labels=['0-12', '13-24', '25-36', '37-48', '49-60', '61-72'])
+
+# Churn Insights breakdowns: label -> (column, x-axis title)
+BREAKDOWNS = {
+    "Monthly Charges": ("MonthlyCharges_Bin", "Monthly Charges Range"),
+    "Internet Service": ("InternetService", "Internet Service Type"),
+    "Contract": ("Contract", "Contract Type"),
+    "Tenure": ("Tenure_Bin", "Tenure Range (Months)"),
+    "Online Security": ("OnlineSecurity", "Online Security Status"),
+}
+DEFAULT_BREAKDOWN = "Monthly Charges"
+
+
+@lru_cache(maxsize=None)
+def churn_breakdown(name):
+    """Churn counts for one breakdown, computed on first use and kept for the process."""
+    column, title = BREAKDOWNS[name]
+    counts = (
+        df.groupby([column, 'Churn']).size()
+        .unstack(fill_value=0)
+        .reindex(columns=['Yes', 'No'], fill_value=0)
+    )
+    return {
+        "x": tuple(str(label) for label in counts.index),
+        "yes": counts['Yes'].to_numpy(dtype="int32"),
+        "no": counts['No'].to_numpy(dtype="int32"),
+        "title": title,
+    }